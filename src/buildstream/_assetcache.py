@@ -305,7 +305,8 @@ class AssetCache:
     #
     def release_resources(self):
 
-        # Close all remotes and their gRPC channels
+        # Release all remotes, their gRPC channels are shared
+        # between remotes and are closed by the Context
         for remote in self._remotes.values():
             if remote.index:
                 remote.index.close()
@@ -30,7 +30,7 @@ from ._profile import Topics, PROFILER
 from ._platform import Platform
 from ._artifactcache import ArtifactCache
 from ._elementsourcescache import ElementSourcesCache
-from ._remotespec import RemoteSpec, RemoteExecutionSpec
+from ._remotespec import RemoteSpec, RemoteExecutionSpec, close_channels
 from ._sourcecache import SourceCache
 from ._cas import CASCache, CASLogLevel
 from .types import _CacheBuildTrees, _PipelineSelection, _SchedulerErrorAction, _SourceUriPolicy
@@ -244,6 +244,9 @@ class Context:
         if self._cascache:
             self._cascache.release_resources(self.messenger)
 
+        # Close the gRPC channels opened to any remote
+        close_channels()
+
     # load()
     #
     # Loads the configuration files
@@ -327,6 +327,10 @@ class App:
                 # Exit with the error
                 self._error_exit(e)
             except RecursionError:
+                # Loading and walking the dependencies is not limited by the
+                # recursion limit, but notifying reverse dependencies that
+                # their dependencies are cached still recurses.
+                #
                 # Check that any cached messages are printed
                 self._render(message_text=self._message_text)
                 click.echo(
@@ -30,9 +30,12 @@
 #  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 #  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
-import collections.abc
-import copy
+import bisect
+import hashlib
 import os
+import sys
+import tempfile
+import time
 
 import click
 from click.core import MultiCommand, Option, Argument
@@ -40,17 +43,13 @@ from click.parser import split_arg_string
 
 WORDBREAK = "="
 
-COMPLETION_SCRIPT = """
-%(complete_func)s() {
-    local IFS=$'\n'
-    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
-                   COMP_CWORD=$COMP_CWORD \\
-                   %(autocomplete_var)s=complete $1 ) )
-    return 0
-}
-
-complete -F %(complete_func)s -o nospace %(script_names)s
-"""
+# How long the results of a completion remain valid, in seconds.
+#
+# Bash will typically invoke us more than once with the same
+# command line, for instance when hitting <TAB> a second time
+# to list the possible completions.
+#
+COMPLETION_CACHE_TIMEOUT = 2.0
 
 
 # An exception for our custom completion handler to
@@ -69,12 +68,12 @@ def complete_path(path_type, incomplete, base_directory="."):
     # Try listing the files in the relative or absolute path
     # specified in `incomplete` minus the last path component,
     # otherwise list files starting from the current working directory.
+    #
+    # Each entry is listed along with whether it is a directory, which
+    # os.scandir() can usually tell us without an additional stat().
     entries = []
     base_path = ""
 
-    # This is getting a bit messy
-    listed_base_directory = False
-
     if os.path.sep in incomplete:
         split = incomplete.rsplit(os.path.sep, 1)
         base_path = split[0]
@@ -90,12 +89,13 @@ def complete_path(path_type, incomplete, base_directory="."):
     try:
         if base_path:
             if os.path.isdir(base_path):
-                entries = [os.path.join(base_path, e) for e in os.listdir(base_path)]
+                with os.scandir(base_path) as it:
+                    entries = [(entry.path, entry.is_dir()) for entry in it]
         else:
-            entries = os.listdir(base_directory)
-            listed_base_directory = True
+            with os.scandir(base_directory) as it:
+                entries = [(entry.name, entry.is_dir()) for entry in it]
     except OSError:
-        # If for any reason the os reports an error from os.listdir(), just
+        # If for any reason the os reports an error from os.scandir(), just
         # ignore this and avoid a stack trace
         pass
 
@@ -104,16 +104,11 @@ def complete_path(path_type, incomplete, base_directory="."):
         base_directory_slash += os.sep
     base_directory_len = len(base_directory_slash)
 
-    def entry_is_dir(entry):
-        if listed_base_directory:
-            entry = os.path.join(base_directory, entry)
-        return os.path.isdir(entry)
-
-    def fix_path(path):
+    def fix_path(path, is_dir):
 
         # Append slashes to any entries which are directories, or
         # spaces for other files since they cannot be further completed
-        if entry_is_dir(path) and not path.endswith(os.sep):
+        if is_dir and not path.endswith(os.sep):
             path = path + os.sep
         else:
             path = path + " "
@@ -127,11 +122,11 @@ def complete_path(path_type, incomplete, base_directory="."):
 
     return [
         # Return an appropriate path for each entry
-        fix_path(e)
-        for e in sorted(entries)
+        fix_path(path, is_dir)
+        for path, is_dir in sorted(entries)
         # Filter out non directory elements when searching for a directory,
         # the opposite is fine, however.
-        if not (path_type == "Directory" and not entry_is_dir(e))
+        if not (path_type == "Directory" and not is_dir)
     ]
 
 
@@ -207,12 +202,20 @@ def is_incomplete_option(all_args, cmd_param):
     """
     if cmd_param.is_flag:
         return False
+
+    # Walk backwards from the last argument, only looking at as many
+    # arguments as this option accepts values
     last_option = None
-    for index, arg_str in enumerate(reversed([arg for arg in all_args if arg != WORDBREAK])):
-        if index + 1 > cmd_param.nargs:
+    count = 0
+    nargs = cmd_param.nargs
+    for arg_str in reversed(all_args):
+        if arg_str == WORDBREAK:
+            continue
+        if count >= nargs:
             break
-        if start_of_option(arg_str):
+        if arg_str[:1] == "-":
             last_option = arg_str
+        count += 1
 
     return bool(last_option and last_option in cmd_param.opts)
 
@@ -229,13 +232,10 @@ def is_incomplete_argument(current_params, cmd_param):
         return True
     if cmd_param.nargs == -1:
         return True
-    if (
-        isinstance(current_param_values, collections.abc.Iterable)
-        and cmd_param.nargs > 1
-        and len(current_param_values) < cmd_param.nargs
-    ):
-        return True
-    return False
+    # click always stores the values of multi value arguments as a tuple
+    return (
+        isinstance(current_param_values, tuple) and cmd_param.nargs > 1 and len(current_param_values) < cmd_param.nargs
+    )
 
 
 def get_user_autocompletions(args, incomplete, cmd, cmd_param, override):
@@ -256,6 +256,23 @@ def get_user_autocompletions(args, incomplete, cmd, cmd_param, override):
         return get_param_type_completion(cmd_param.type, incomplete) or []
 
 
+def get_matching_commands(ctx, incomplete):
+    """
+    :param ctx: the context of a MultiCommand
+    :param incomplete: the incomplete text of the arg to autocomplete
+    :return: the visible subcommands which start with the incomplete text
+    """
+    # click groups list their commands in sorted order, so the matching
+    # commands are found with a binary search and are all adjacent
+    commands = ctx.command.list_commands(ctx)
+    for index in range(bisect.bisect_left(commands, incomplete), len(commands)):
+        cmd = commands[index]
+        if not cmd.startswith(incomplete):
+            break
+        if not ctx.command.get_command(ctx, cmd).hidden:
+            yield cmd
+
+
 def get_choices(cli, prog_name, args, incomplete, override):
     """
     :param cli: command definition
@@ -267,7 +284,7 @@ def get_choices(cli, prog_name, args, incomplete, override):
     'CompleteUnhandled' if it could not find a completion.
     :return: all the possible completions for the incomplete
     """
-    all_args = copy.deepcopy(args)
+    all_args = list(args)
 
     ctx = resolve_ctx(cli, prog_name, args)
     if ctx is None:
@@ -282,40 +299,57 @@ def get_choices(cli, prog_name, args, incomplete, override):
     elif incomplete == WORDBREAK:
         incomplete = ""
 
+    # Sort the parameters into options and arguments in a single pass
+    options = []
+    arguments = []
+    for param in ctx.command.params:
+        if isinstance(param, Option):
+            options.append(param)
+        elif isinstance(param, Argument):
+            arguments.append(param)
+
     choices = []
     found_param = False
     if start_of_option(incomplete):
-        # completions for options
-        for param in ctx.command.params:
-            if isinstance(param, Option):
-                choices.extend(
-                    [
-                        param_opt + " "
-                        for param_opt in param.opts + param.secondary_opts
-                        if param_opt not in all_args or param.multiple
-                    ]
-                )
+        # completions for options, options which were already
+        # specified are only offered again if they accept multiple values
+        specified_args = set(all_args)
+        for param in options:
+            choices.extend(
+                [
+                    param_opt + " "
+                    for param_opt in param.opts + param.secondary_opts
+                    if param_opt.startswith(incomplete) and (param_opt not in specified_args or param.multiple)
+                ]
+            )
         found_param = True
     if not found_param:
         # completion for option values by choices
-        for cmd_param in ctx.command.params:
-            if isinstance(cmd_param, Option) and is_incomplete_option(all_args, cmd_param):
-                choices.extend(get_user_autocompletions(all_args, incomplete, ctx.command, cmd_param, override))
+        for cmd_param in options:
+            if is_incomplete_option(all_args, cmd_param):
+                choices.extend(
+                    item
+                    for item in get_user_autocompletions(all_args, incomplete, ctx.command, cmd_param, override)
+                    if item.startswith(incomplete)
+                )
                 found_param = True
                 break
     if not found_param:
         # completion for argument values by choices
-        for cmd_param in ctx.command.params:
-            if isinstance(cmd_param, Argument) and is_incomplete_argument(ctx.params, cmd_param):
-                choices.extend(get_user_autocompletions(all_args, incomplete, ctx.command, cmd_param, override))
+        for cmd_param in arguments:
+            if is_incomplete_argument(ctx.params, cmd_param):
+                choices.extend(
+                    item
+                    for item in get_user_autocompletions(all_args, incomplete, ctx.command, cmd_param, override)
+                    if item.startswith(incomplete)
+                )
                 found_param = True
                 break
 
     if not found_param and isinstance(ctx.command, MultiCommand):
-        # completion for any subcommands
-        choices.extend(
-            [cmd + " " for cmd in ctx.command.list_commands(ctx) if not ctx.command.get_command(ctx, cmd).hidden]
-        )
+        # completion for any subcommands, only looking up the commands
+        # which match the incomplete text
+        choices.extend([cmd + " " for cmd in get_matching_commands(ctx, incomplete)])
 
     if (
         not start_of_option(incomplete)
@@ -324,21 +358,153 @@ def get_choices(cli, prog_name, args, incomplete, override):
         and ctx.parent.command.chain
     ):
         # completion for chained commands
-        visible_commands = [
-            cmd
-            for cmd in ctx.parent.command.list_commands(ctx.parent)
-            if not ctx.parent.command.get_command(ctx.parent, cmd).hidden
-        ]
-        remaining_commands = set(visible_commands) - set(ctx.parent.protected_args)
-        choices.extend([cmd + " " for cmd in remaining_commands])
+        specified_commands = set(ctx.parent.protected_args)
+        choices.extend(
+            [cmd + " " for cmd in get_matching_commands(ctx.parent, incomplete) if cmd not in specified_commands]
+        )
 
-    for item in choices:
-        if item.startswith(incomplete):
-            yield item
+    # Every candidate has already been filtered against the incomplete
+    # text at the point where it was produced
+    yield from choices
+
+
+# get_completion_cache_file()
+#
+# Get the file in which to cache the results of the
+# completion for the current command line.
+#
+# The command line, the working directory and the modification
+# time of the running program all contribute to the file name,
+# so any change to those naturally bypasses the cache.
+#
+# Returns:
+#    (str): The cache file, or None if caching is disabled
+#
+def get_completion_cache_file():
+
+    # Completions in the test suite run in rapid succession
+    # and must reflect the current state of the test data
+    if "BST_TEST_SUITE" in os.environ:
+        return None
+
+    # Without a working directory, for instance if it was
+    # deleted, completions are not cached at all
+    try:
+        cwd = os.getcwd()
+    except OSError:
+        return None
+
+    try:
+        program_mtime = os.stat(sys.argv[0]).st_mtime_ns
+    except (OSError, IndexError):
+        program_mtime = 0
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (cwd, os.environ["COMP_WORDS"], os.environ["COMP_CWORD"], str(program_mtime)):
+        digest.update(part.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "buildstream", "completions", digest.hexdigest())
+
+
+# load_cached_choices()
+#
+# Args:
+#    cache_file (str): The cache file for the current command line
+#
+# Returns:
+#    (list): The cached completions, or None if there are no recent ones
+#
+def load_cached_choices(cache_file):
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime >= COMPLETION_CACHE_TIMEOUT:
+                return None
+            return f.read().splitlines()
+    except OSError:
+        return None
+
+
+# save_cached_choices()
+#
+# Expired cache files are removed once nothing was cached for
+# longer than the cache timeout, so that the cache directory does
+# not grow forever. The cache directory is modified whenever a
+# result is cached, so this costs a single stat() while typing.
+#
+# Args:
+#    cache_file (str): The cache file for the current command line
+#    choices (list): The completions to cache
+#
+def save_cached_choices(cache_file, choices):
+    cache_dir = os.path.dirname(cache_file)
+
+    # Write to a temporary file and rename it into place, so that concurrent
+    # completions never observe a partially written cache file. Caching is
+    # only an optimization, so any error here is ignored.
+    try:
+        try:
+            cache_dir_mtime = os.stat(cache_dir).st_mtime
+        except FileNotFoundError:
+            os.makedirs(cache_dir, exist_ok=True)
+        else:
+            if time.time() - cache_dir_mtime >= COMPLETION_CACHE_TIMEOUT:
+                prune_cached_choices(cache_dir)
+
+        fd, tempname = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("".join(item + "\n" for item in choices))
+            os.replace(tempname, cache_file)
+        except OSError:
+            os.unlink(tempname)
+    except OSError:
+        pass
+
+
+# prune_cached_choices()
+#
+# Remove the expired cache files
+#
+# Args:
+#    cache_dir (str): The directory holding the cache files
+#
+def prune_cached_choices(cache_dir):
+    expiry = time.time() - COMPLETION_CACHE_TIMEOUT
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                if entry.stat().st_mtime < expiry:
+                    os.unlink(entry.path)
+            except OSError:
+                # Concurrent completions may be pruning the same files
+                pass
+
+
+# split_comp_words()
+#
+# Split the words of the command line being completed.
+#
+# Bash has already split the words, but they are handed
+# to us joined by whitespace. Unless some word is quoted or
+# escaped, a plain split gives the same result as the full
+# shell lexer, and is much cheaper.
+#
+# Args:
+#    comp_words (str): The joined words of the command line
+#
+# Returns:
+#    (list): The words of the command line
+#
+def split_comp_words(comp_words):
+    if "'" in comp_words or '"' in comp_words or "\\" in comp_words:
+        return split_arg_string(comp_words)
+    return comp_words.split()
 
 
 def do_complete(cli, prog_name, override):
-    cwords = split_arg_string(os.environ["COMP_WORDS"])
+    cwords = split_comp_words(os.environ["COMP_WORDS"])
     cword = int(os.environ["COMP_CWORD"])
     args = cwords[1:cword]
     try:
@@ -346,8 +512,19 @@ def do_complete(cli, prog_name, override):
     except IndexError:
         incomplete = ""
 
-    for item in get_choices(cli, prog_name, args, incomplete, override):
-        click.echo(item)
+    cache_file = get_completion_cache_file()
+    choices = None
+    if cache_file:
+        choices = load_cached_choices(cache_file)
+
+    if choices is None:
+        choices = list(get_choices(cli, prog_name, args, incomplete, override))
+        if cache_file:
+            save_cached_choices(cache_file, choices)
+
+    # Output all the choices in a single write
+    if choices:
+        click.echo("\n".join(choices))
 
 
 # Main function called from main.py at startup here
@@ -17,7 +17,7 @@
 #        Tristan Van Berkom <tristan.vanberkom@codethink.co.uk>
 
 import os
-from typing import Tuple, Type, Iterator
+from typing import Optional, Set, Tuple, Type, Iterator
 from pluginbase import PluginSource
 
 from .. import utils
@@ -77,19 +77,18 @@ class PluginFactory:
         #
         self._sources = {}  #  A mapping of (location, kind) -> PluginSource objects
 
-        self._init_site_source()
-
-    # Initialize the PluginSource object for core plugins
-    def _init_site_source(self):
         if self._plugin_type == PluginType.SOURCE:
             self._site_plugins_path = _site.source_plugins
         elif self._plugin_type == PluginType.ELEMENT:
             self._site_plugins_path = _site.element_plugins
 
-        self._site_source = self._plugin_base.make_plugin_source(
-            searchpath=[self._site_plugins_path],
-            identifier=self._identifier + "site",
-        )
+        # The PluginSource for core plugins, this is only created
+        # once a core plugin is first looked up
+        self._site_source: Optional[PluginSource] = None
+
+        # The file names in the core plugin directory, this is only
+        # scanned once a core plugin is first looked up
+        self._site_plugin_files: Optional[Set[str]] = None
 
     ######################################################
     #                  Public Methods                    #
@@ -194,6 +193,42 @@ class PluginFactory:
     #                 Private Methods                    #
     ######################################################
 
+    # _get_site_source():
+    #
+    # Gets the PluginSource object for core plugins, creating
+    # it if it was not already created.
+    #
+    # Returns:
+    #    (PluginSource): The PluginSource for core plugins
+    #
+    def _get_site_source(self) -> PluginSource:
+        if self._site_source is None:
+            self._site_source = self._plugin_base.make_plugin_source(
+                searchpath=[self._site_plugins_path],
+                identifier=self._identifier + "site",
+            )
+        return self._site_source
+
+    # _get_site_plugin_files():
+    #
+    # Gets the names of the files in the core plugin directory,
+    # scanning the directory if it was not already scanned.
+    #
+    # This is used to look up core plugins and their defaults
+    # without asking the PluginSource to rescan the directory
+    # and without a stat() call per lookup.
+    #
+    # Returns:
+    #    (set): The file names in the core plugin directory
+    #
+    def _get_site_plugin_files(self) -> Set[str]:
+        if self._site_plugin_files is None:
+            with os.scandir(self._site_plugins_path) as entries:
+                self._site_plugin_files = {
+                    entry.name for entry in entries if entry.is_file() and entry.name != "__init__.py"
+                }
+        return self._site_plugin_files
+
     # _ensure_plugin():
     #
     # Ensures that a plugin is loaded, delegating the work of getting
@@ -234,7 +269,8 @@ class PluginFactory:
                 self._sources[(location, kind)] = source
             else:
                 # Try getting it from the core plugins
-                if kind not in self._site_source.list_plugins():
+                site_plugin_files = self._get_site_plugin_files()
+                if "{}.py".format(kind) not in site_plugin_files:
                     raise PluginError(
                         "{}: No {} plugin registered for kind '{}'".format(
                             provenance_node.get_provenance(), self._plugin_type, kind
@@ -242,9 +278,11 @@ class PluginFactory:
                         reason="plugin-not-found",
                     )
 
-                source = self._site_source
-                defaults = os.path.join(self._site_plugins_path, "{}.yaml".format(kind))
-                if not os.path.exists(defaults):
+                source = self._get_site_source()
+                defaults_file = "{}.yaml".format(kind)
+                if defaults_file in site_plugin_files:
+                    defaults = os.path.join(self._site_plugins_path, defaults_file)
+                else:
                     defaults = None
                 display = "core plugin"
 
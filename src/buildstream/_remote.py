@@ -76,11 +76,14 @@ class BaseRemote:
             self._configure_protocols()
             self._initialized = True
 
+    # close():
+    #
+    # Release the remote. The channel itself is shared with any other
+    # remote using an equal spec, and is closed when the Context releases
+    # its resources.
+    #
     def close(self):
-        if self.channel:
-            self.channel.close()
-            self.channel = None
-
+        self.channel = None
         self._initialized = False
 
     # check():
@@ -15,8 +15,11 @@
 #  limitations under the License.
 #
 
+import atexit
+import functools
 import os
-from typing import Optional, Tuple, List, cast
+import threading
+from typing import Dict, Optional, Tuple, List, cast
 from urllib.parse import urlparse
 import grpc
 from grpc import ChannelCredentials, Channel
@@ -27,6 +30,87 @@ from .types import FastEnum
 from .node import MappingNode
 
 
+# The open gRPC channels, shared by equal RemoteSpecs so that connections
+# to the same remote are reused, these are closed with close_channels()
+# when the Context releases its resources, or when the process exits.
+#
+# Each spec has a small pool of channels, each with its own connection,
+# so that many concurrent requests to the same remote are not all
+# multiplexed over a single HTTP/2 connection, which limits the number
+# of concurrent streams. The first channel of the pool is the one
+# returned by RemoteSpec.open_channel().
+#
+# The size of the pool can be overridden with the BST_GRPC_POOL_SIZE
+# environment variable, a larger pool trades more connections and the
+# memory they use for throughput under concurrent bulk transfers.
+#
+_CHANNEL_POOL_SIZE = 4
+try:
+    _CHANNEL_POOL_SIZE = max(1, int(os.environ.get("BST_GRPC_POOL_SIZE", _CHANNEL_POOL_SIZE)))
+except ValueError:
+    pass
+
+# Options for the channels, which are kept open for the whole session.
+#
+# Keepalive pings detect connections which were silently dropped, for
+# instance by a NAT or a load balancer. Pings are only sent while calls
+# are in flight, not while the connection is idle, so a dead connection
+# is noticed about 5m20s into a call (the ping interval plus the ping
+# timeout) instead of the call hanging until the TCP connection times
+# out. The ping interval matches the minimum interval that gRPC servers
+# accept by default.
+#
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300000),
+    ("grpc.keepalive_timeout_ms", 20000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+_channels: Dict["RemoteSpec", List[Channel]] = {}
+_channels_next: Dict["RemoteSpec", int] = {}
+_channels_lock = threading.Lock()
+
+
+# close_channels()
+#
+# Close all the channels opened with RemoteSpec.open_channel()
+# and RemoteSpec.next_channel()
+#
+def close_channels() -> None:
+    with _channels_lock:
+        for pool in _channels.values():
+            for channel in pool:
+                channel.close()
+        _channels.clear()
+        _channels_next.clear()
+
+
+atexit.register(close_channels)
+
+
+# _ssl_channel_credentials()
+#
+# Create the grpc credentials for the given certificates and key.
+#
+# The credentials are shared by all specs using the same certificates,
+# such as the various services of a remote execution cluster.
+#
+# Args:
+#    root_certificates: The server certificate
+#    private_key: The client key
+#    certificate_chain: The client certificate
+#
+# Returns:
+#    The grpc credentials
+#
+@functools.lru_cache(maxsize=64)
+def _ssl_channel_credentials(
+    root_certificates: Optional[bytes], private_key: Optional[bytes], certificate_chain: Optional[bytes]
+) -> ChannelCredentials:
+    return grpc.ssl_channel_credentials(
+        root_certificates=root_certificates, private_key=private_key, certificate_chain=certificate_chain
+    )
+
+
 # RemoteType():
 #
 # Defines the different types of remote.
@@ -38,9 +122,13 @@ class RemoteType(FastEnum):
     ALL = "all"
 
     def __str__(self) -> str:
-        if self.name:
-            return self.name.lower().replace("_", "-")
-        return ""
+        return _REMOTE_TYPE_STRINGS[self]
+
+
+# The string representations of the RemoteTypes, computed only once
+_REMOTE_TYPE_STRINGS = {
+    RemoteType(value): RemoteType(value).name.lower().replace("_", "-") for value in RemoteType.values()
+}
 
 
 # RemoteSpecPurpose():
@@ -57,6 +145,17 @@ class RemoteSpecPurpose(FastEnum):
     PULL = 2  # Only pulling
 
 
+# The valid keys of a remote spec, of the remote specs for
+# the services of a remote execution configuration, and of
+# their auth configuration
+_REMOTE_SPEC_KEYS = ["url", "instance-name", "auth", "push", "type"]
+_REMOTE_EXECUTION_SPEC_KEYS = ["url", "instance-name", "auth"]
+_AUTH_KEYS = ["server-cert", "client-key", "client-cert"]
+
+# The remote types which can be specified for a remote on the command line
+_REMOTE_SPEC_TYPES = [str(RemoteType.INDEX), str(RemoteType.STORAGE), str(RemoteType.ALL)]
+
+
 # RemoteSpec():
 #
 # This data structure holds all of the details required to
@@ -65,9 +164,30 @@ class RemoteSpecPurpose(FastEnum):
 # execution service.
 #
 class RemoteSpec:
+    __slots__ = [
+        "remote_type",
+        "push",
+        "url",
+        "instance_name",
+        "server_cert_file",
+        "client_key_file",
+        "client_cert_file",
+        "_spec_node",
+        "_provenance",
+        "_server_cert",
+        "_client_key",
+        "_client_cert",
+        "_credentials",
+        "_scheme",
+        "_target",
+        "_has_port",
+        "_key",
+        "_hash",
+    ]
+
     def __init__(
         self,
-        remote_type: str,
+        remote_type: RemoteType,
         url: str,
         *,
         push: bool = False,
@@ -83,7 +203,7 @@ class RemoteSpec:
         #
 
         # The remote type
-        self.remote_type: str = remote_type
+        self.remote_type: RemoteType = remote_type
 
         # Whether we are allowed to push (for asset caches only)
         self.push: bool = push
@@ -106,89 +226,174 @@ class RemoteSpec:
         # The provenance node for error reporting
         self._spec_node: Optional[MappingNode] = spec_node
 
-        # The credentials loaded from disk, and whether they were loaded
+        # The provenance string, only formatted once it is needed
+        self._provenance: Optional[str] = None
+
+        # The credentials loaded from disk, each file is only
+        # loaded the first time its content is needed
         self._server_cert: Optional[bytes] = None
         self._client_key: Optional[bytes] = None
         self._client_cert: Optional[bytes] = None
-        self._cred_files_loaded: bool = False
 
         # The grpc credentials object
         self._credentials: Optional[ChannelCredentials] = None
 
+        # The url parsed into the scheme and the "host:port" target to
+        # open channels to, the target is None if the port is invalid.
+        self._scheme: str
+        self._target: Optional[str]
+        self._has_port: bool
+        try:
+            self._scheme, self._target, self._has_port = self._parse_url(url)
+        except ValueError as e:
+            message = "Invalid URL '{}': {}".format(url, e)
+            if spec_node:
+                message = "{}: {}".format(spec_node.get_provenance(), message)
+            raise RemoteError(message) from e
+
+        # The identity of the spec and its hash, specs are used as dictionary
+        # keys and their members are never modified after construction
+        self._key: Tuple = (
+            self.remote_type,
+            self.push,
+            self.url,
+            self.instance_name,
+            self.server_cert_file,
+            self.client_key_file,
+            self.client_cert_file,
+        )
+        self._hash: int = hash(self._key)
+
     #
     # Implement dunder methods to support hashing and
     # comparisons.
     #
     def __eq__(self, other: object) -> bool:
-        return hash(self) == hash(other)
+        if not isinstance(other, RemoteSpec):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.remote_type,
-                self.push,
-                self.url,
-                self.instance_name,
-                self.server_cert_file,
-                self.client_key_file,
-                self.client_cert_file,
-            )
-        )
+        return self._hash
 
     def __str__(self) -> str:
-        string = self.url + "\n"
-        string += "push: {} type: {} instance: {}\n".format(self.push, self.remote_type, self.instance_name)
-        if self._spec_node:
-            provenance = str(self._spec_node.get_provenance())
-        else:
-            provenance = "command line"
-        string += "loaded from: {}".format(provenance)
+        if self._provenance is None:
+            if self._spec_node:
+                self._provenance = str(self._spec_node.get_provenance())
+            else:
+                self._provenance = "command line"
 
-        return string
+        return "{}\npush: {} type: {} instance: {}\nloaded from: {}".format(
+            self.url, self.push, self.remote_type, self.instance_name, self._provenance
+        )
 
     # server_cert()
     #
     @property
     def server_cert(self) -> Optional[bytes]:
-        self._load_credential_files()
+        if self._server_cert is None and self.server_cert_file:
+            self._server_cert = self._read_credential_file(self.server_cert_file)
         return self._server_cert
 
     # client_key()
     #
     @property
     def client_key(self) -> Optional[bytes]:
-        self._load_credential_files()
+        if self._client_key is None and self.client_key_file:
+            self._client_key = self._read_credential_file(self.client_key_file)
         return self._client_key
 
     # client_cert()
     #
     @property
     def client_cert(self) -> Optional[bytes]:
-        self._load_credential_files()
+        if self._client_cert is None and self.client_cert_file:
+            self._client_cert = self._read_credential_file(self.client_cert_file)
         return self._client_cert
 
     # credentials()
     #
+    # The credentials are only needed for secure channels, this
+    # is None for remotes which are not accessed over https.
+    #
     @property
-    def credentials(self) -> ChannelCredentials:
+    def credentials(self) -> Optional[ChannelCredentials]:
+        if self._scheme != "https":
+            return None
+
         if not self._credentials:
-            self._credentials = grpc.ssl_channel_credentials(
-                root_certificates=self.server_cert,
-                private_key=self.client_key,
-                certificate_chain=self.client_cert,
-            )
+            self._load_credential_files()
+            self._credentials = _ssl_channel_credentials(self._server_cert, self._client_key, self._client_cert)
         return self._credentials
 
     # open_channel()
     #
     # Opens a gRPC channel based on this spec.
     #
+    # Channels are shared by all equal specs and remain open until
+    # close_channels() is called, callers must not close the returned
+    # channel.
+    #
     def open_channel(self) -> Channel:
-        url = urlparse(self.url)
+        with _channels_lock:
+            try:
+                return _channels[self][0]
+            except KeyError:
+                pass
+
+            channel = self._create_channel()
+            _channels[self] = [channel]
+            _channels_next[self] = 0
+            return channel
+
+    # next_channel()
+    #
+    # Gets one of the gRPC channels of the pool for this spec, in
+    # a round robin fashion, opening new channels as needed.
+    #
+    # This should be preferred over open_channel() for requests which
+    # may be issued concurrently, trading a few more connections for
+    # throughput. Like with open_channel(), callers must not close
+    # the returned channel.
+    #
+    def next_channel(self) -> Channel:
+        with _channels_lock:
+            pool = _channels.get(self, [])
+            index = _channels_next.get(self, 0)
+
+            # Only register the channel once it was successfully created,
+            # so that a failure does not leave an empty pool behind
+            if index < len(pool):
+                channel = pool[index]
+            else:
+                channel = self._create_channel()
+                _channels.setdefault(self, []).append(channel)
+
+            _channels_next[self] = (index + 1) % _CHANNEL_POOL_SIZE
+            return channel
+
+    # _create_channel()
+    #
+    # Creates a new gRPC channel based on this spec.
+    #
+    # Each channel uses a local subchannel pool, this ensures that grpc
+    # does not share the underlying connection between channels.
+    #
+    def _create_channel(self) -> Channel:
+        options = [("grpc.use_local_subchannel_pool", 1)] + _CHANNEL_OPTIONS
+
+        # Report invalid port numbers first, a port which
+        # could not be parsed is not missing
+        #
+        if self._target is None:
+            message = "Invalid port number in URL: {}".format(self.url)
+            if self._spec_node:
+                message = "{}: {}".format(self._spec_node.get_provenance(), message)
+            raise RemoteError(message)
 
         # Assert port number for RE endpoints
         #
-        if self.remote_type == RemoteType.ENDPOINT and not url.port:
+        if self.remote_type is RemoteType.ENDPOINT and not self._has_port:
             message = (
                 "Remote execution endpoints must specify the port number, for example: http://buildservice:50051."
             )
@@ -196,17 +401,16 @@ class RemoteSpec:
                 message = "{}: {}".format(self._spec_node.get_provenance(), message)
             raise RemoteError(message)
 
-        if url.scheme == "http":
-            channel = grpc.insecure_channel("{}:{}".format(url.hostname, url.port or 80))
-        elif url.scheme == "https":
-            channel = grpc.secure_channel("{}:{}".format(url.hostname, url.port or 443), self.credentials)
-        else:
-            message = "Only 'http' and 'https' protocols are supported, but '{}' was supplied.".format(url.scheme)
+        if self._scheme not in ("http", "https"):
+            message = "Only 'http' and 'https' protocols are supported, but '{}' was supplied.".format(self._scheme)
             if self._spec_node:
                 message = "{}: {}".format(self._spec_node.get_provenance(), message)
             raise RemoteError(message)
 
-        return channel
+        if self._scheme == "http":
+            return grpc.insecure_channel(self._target, options=options)
+
+        return grpc.secure_channel(self._target, self.credentials, options=options)
 
     # new_from_node():
     #
@@ -222,6 +426,7 @@ class RemoteSpec:
     #
     # Raises:
     #    LoadError: If the node is malformed.
+    #    RemoteError: If the url cannot be parsed.
     #
     @classmethod
     def new_from_node(
@@ -231,13 +436,22 @@ class RemoteSpec:
         client_key: Optional[str] = None
         client_cert: Optional[str] = None
         push: bool = False
-        remote_type: str = RemoteType.ENDPOINT
+        remote_type: RemoteType = RemoteType.ENDPOINT
+
+        instance_name: Optional[str] = None
 
-        valid_keys: List[str] = ["url", "instance-name", "auth"]
+        # Enumerate the specified keys once, so that the optional keys
+        # which are not specified do not need to be looked up at all
+        keys = spec_node.keys()
+
+        valid_keys: List[str] = _REMOTE_EXECUTION_SPEC_KEYS
         if not remote_execution:
-            remote_type = cast(str, spec_node.get_enum("type", RemoteType, default=RemoteType.ALL))
-            push = spec_node.get_bool("push", default=False)
-            valid_keys += ["push", "type"]
+            remote_type = RemoteType.ALL
+            if "type" in keys:
+                remote_type = cast(RemoteType, spec_node.get_enum("type", RemoteType))
+            if "push" in keys:
+                push = spec_node.get_bool("push")
+            valid_keys = _REMOTE_SPEC_KEYS
 
         spec_node.validate_keys(valid_keys)
 
@@ -250,11 +464,13 @@ class RemoteSpec:
             provenance = spec_node.get_node("url").get_provenance()
             raise LoadError("{}: empty artifact cache URL".format(provenance), LoadErrorReason.INVALID_DATA)
 
-        instance_name = spec_node.get_str("instance-name", default=None)
+        if "instance-name" in keys:
+            instance_name = spec_node.get_str("instance-name", default=None)
 
-        auth_node = spec_node.get_mapping("auth", None)
-        if auth_node:
-            server_cert, client_key, client_cert = cls._parse_auth(auth_node, basedir)
+        if "auth" in keys:
+            auth_node = spec_node.get_mapping("auth", None)
+            if auth_node:
+                server_cert, client_key, client_cert = cls._parse_auth(auth_node, basedir)
 
         return cls(
             remote_type,
@@ -288,7 +504,7 @@ class RemoteSpec:
     def new_from_string(cls, string: str, purpose: int = RemoteSpecPurpose.ALL) -> "RemoteSpec":
         url: Optional[str] = None
         instance_name: Optional[str] = None
-        remote_type: str = RemoteType.ALL
+        remote_type: RemoteType = RemoteType.ALL
         push: bool = True
         server_cert: Optional[str] = None
         client_key: Optional[str] = None
@@ -315,13 +531,11 @@ class RemoteSpec:
                 elif key == "instance-name":
                     instance_name = val
                 elif key == "type":
-                    remote_type = val
-                    if remote_type not in [RemoteType.INDEX, RemoteType.STORAGE, RemoteType.ALL]:
+                    if val not in _REMOTE_SPEC_TYPES:
                         raise RemoteError(
-                            "Value for remote 'type' must be one of: {}".format(
-                                ", ".join([RemoteType.INDEX, RemoteType.STORAGE, RemoteType.ALL])
-                            )
+                            "Value for remote 'type' must be one of: {}".format(", ".join(_REMOTE_SPEC_TYPES))
                         )
+                    remote_type = RemoteType(val)
                 elif key == "push":
 
                     # Provide a sensible error for `bst artifact push --remote url=http://pony.com,push=False ...`
@@ -359,6 +573,39 @@ class RemoteSpec:
             instance_name=instance_name,
         )
 
+    # _parse_url()
+    #
+    # Parse the url of a remote
+    #
+    # Args:
+    #    url: The url
+    #
+    # Returns:
+    #    A 3 tuple containing the scheme, the "host:port" target
+    #    to connect to or None if the port is invalid, and whether
+    #    the url explicitly specified the port
+    #
+    # Raises:
+    #    ValueError: If the url cannot be parsed at all
+    #
+    # The results are cached, as several specs usually share the
+    # same url, like the various services of a cache server.
+    #
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_url(url: str) -> Tuple[str, Optional[str], bool]:
+        parsed = urlparse(url)
+        try:
+            port = parsed.port
+        except ValueError:
+            return parsed.scheme, None, False
+
+        if port:
+            return parsed.scheme, "{}:{}".format(parsed.hostname, port), True
+
+        default_port = 443 if parsed.scheme == "https" else 80
+        return parsed.scheme, "{}:{}".format(parsed.hostname, default_port), False
+
     # _resolve_path()
     #
     # Resolve a path relative to the base directory
@@ -373,9 +620,28 @@ class RemoteSpec:
     @classmethod
     def _resolve_path(cls, path: str, basedir: Optional[str]) -> str:
         path = os.path.expanduser(path)
-        if basedir:
+        if basedir and not os.path.isabs(path):
             path = os.path.join(basedir, path)
-        return path
+        return os.path.normpath(path)
+
+    # _resolve_auth_path()
+    #
+    # Resolve the path of a file specified in the "auth" data
+    #
+    # Args:
+    #    auth_node: The auth node
+    #    key: The key of the file in the auth node
+    #    basedir: The base directory which cert files are relative to, or None
+    #
+    # Returns:
+    #    The resolved path, or None if the file is not specified
+    #
+    @classmethod
+    def _resolve_auth_path(cls, auth_node: MappingNode, key: str, basedir: Optional[str]) -> Optional[str]:
+        path = auth_node.get_str(key, None)
+        if not path:
+            return None
+        return cls._resolve_path(path, basedir)
 
     # _parse_auth():
     #
@@ -394,19 +660,11 @@ class RemoteSpec:
         cls, auth_node: MappingNode, basedir: Optional[str] = None
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
 
-        auth_keys = ["server-cert", "client-key", "client-cert"]
-        auth_values = {}
-        auth_node.validate_keys(auth_keys)
+        auth_node.validate_keys(_AUTH_KEYS)
 
-        for key in auth_keys:
-            value = auth_node.get_str(key, None)
-            if value:
-                value = cls._resolve_path(value, basedir)
-            auth_values[key] = value
-
-        server_cert = auth_values["server-cert"]
-        client_key = auth_values["client-key"]
-        client_cert = auth_values["client-cert"]
+        server_cert = cls._resolve_auth_path(auth_node, "server-cert", basedir)
+        client_key = cls._resolve_auth_path(auth_node, "client-key", basedir)
+        client_cert = cls._resolve_auth_path(auth_node, "client-cert", basedir)
 
         if client_key and not client_cert:
             provenance = auth_node.get_node("client-key").get_provenance()
@@ -424,27 +682,48 @@ class RemoteSpec:
 
     # _load_credential_files():
     #
-    # A helper method to load the credentials files, ignoring any input
-    # arguments that are None.
+    # A helper method to load all of the specified credentials
+    # files which are not already loaded.
     #
     def _load_credential_files(self) -> None:
-        def maybe_read_file(filename: Optional[str]) -> Optional[bytes]:
-            if filename:
-                try:
-                    with open(filename, "rb") as f:
-                        return f.read()
-                except IOError as e:
-                    message = "Failed to load credentials file: {}".format(filename)
-                    if self._spec_node:
-                        message = "{}: {}".format(self._spec_node.get_provenance(), message)
-                    raise RemoteError(message, detail=str(e), reason="load-remote-creds-failed") from e
-            return None
+        # Most remotes do not use any credentials files
+        if not (self.server_cert_file or self.client_key_file or self.client_cert_file):
+            return
+
+        for attr, filename in (
+            ("_server_cert", self.server_cert_file),
+            ("_client_key", self.client_key_file),
+            ("_client_cert", self.client_cert_file),
+        ):
+            if filename and getattr(self, attr) is None:
+                setattr(self, attr, self._read_credential_file(filename))
 
-        if not self._cred_files_loaded:
-            self._server_cert = maybe_read_file(self.server_cert_file)
-            self._client_key = maybe_read_file(self.client_key_file)
-            self._client_cert = maybe_read_file(self.client_cert_file)
-            self._cred_files_loaded = True
+    # _read_credential_file():
+    #
+    # Read a credentials file
+    #
+    # Args:
+    #    filename: The credentials file to read
+    #
+    # Returns:
+    #    The content of the file
+    #
+    # Raises:
+    #    RemoteError: If the file could not be read
+    #
+    def _read_credential_file(self, filename: str) -> bytes:
+        try:
+            with open(filename, "rb") as f:
+                return f.read()
+        except IOError as e:
+            message = "Failed to load credentials file: {}".format(filename)
+            if self._spec_node:
+                message = "{}: {}".format(self._spec_node.get_provenance(), message)
+            raise RemoteError(message, detail=str(e), reason="load-remote-creds-failed") from e
+
+
+# The services of a remote execution configuration
+_REMOTE_EXECUTION_SERVICES = ["execution-service", "storage-service", "action-cache-service"]
 
 
 # RemoteExecutionSpec():
@@ -455,6 +734,8 @@ class RemoteSpec:
 # communicate with various components of an RE build cluster.
 #
 class RemoteExecutionSpec:
+    __slots__ = ["exec_spec", "storage_spec", "action_spec"]
+
     def __init__(
         self, exec_spec: RemoteSpec, storage_spec: Optional[RemoteSpec], action_spec: Optional[RemoteSpec]
     ) -> None:
@@ -480,7 +761,7 @@ class RemoteExecutionSpec:
     def new_from_node(
         cls, node: MappingNode, basedir: Optional[str] = None, *, remote_cache: bool = False
     ) -> "RemoteExecutionSpec":
-        node.validate_keys(["execution-service", "storage-service", "action-cache-service"])
+        node.validate_keys(_REMOTE_EXECUTION_SERVICES)
 
         exec_node = node.get_mapping("execution-service")
         storage_node = node.get_mapping("storage-service", default=None)
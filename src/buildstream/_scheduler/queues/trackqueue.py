@@ -19,6 +19,7 @@
 
 # BuildStream toplevel imports
 from ...plugin import Plugin
+from ...source import Source
 
 # Local imports
 from . import Queue, QueueStatus
@@ -53,12 +54,22 @@ class TrackQueue(Queue):
             return
 
         # Set the new refs in the main process one by one as they complete,
-        # writing to bst files this time
+        # writing to bst files this time.
+        #
+        # The sources of an element usually share the same file, so the
+        # changes of all sources are applied before writing each file once.
+        #
+        # This is all or nothing, if applying the new ref of any source
+        # fails, none of the files are written, not even those holding
+        # the refs of the sources which were successfully applied.
         if result is not None:
+            roundtrip_cache = {}
             for unique_id, new_ref, ref_changed in result:
                 if ref_changed:
                     source = Plugin._lookup(unique_id)
-                    source._set_ref(new_ref, save=True)
+                    source._set_ref(new_ref, save=True, roundtrip_cache=roundtrip_cache)
+
+            Source._save_roundtrip_cache(roundtrip_cache)
 
         element._tracking_done()
 
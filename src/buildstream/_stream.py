@@ -97,6 +97,8 @@ class Stream:
         self._running = False
         self._terminated = False
         self._suspended = False
+        self._total_elements_targets = ()  # The targets for which _total_elements was computed
+        self._total_elements = []  # All elements in the scope of _total_elements_targets
 
     # init()
     #
@@ -1744,6 +1746,22 @@ class Stream:
 
         self.queues.append(queue)
 
+    # _get_total_elements()
+    #
+    # Gets the full list of elements in the scope of the targets,
+    # the dependency graph is only walked again if the targets
+    # have changed since the last call.
+    #
+    # Returns:
+    #    (list): All elements in the scope of the targets
+    #
+    def _get_total_elements(self):
+        targets = tuple(self.targets)
+        if targets != self._total_elements_targets:
+            self._total_elements = list(_pipeline.dependencies(self.targets, _Scope.ALL))
+            self._total_elements_targets = targets
+        return self._total_elements
+
     # _enqueue_plan()
     #
     # Enqueues planned elements to the specified queue.
@@ -1769,7 +1787,7 @@ class Stream:
         # Inform the frontend of the full list of elements
         # and the list of elements which will be processed in this run
         #
-        self.total_elements = list(_pipeline.dependencies(self.targets, _Scope.ALL))
+        self.total_elements = self._get_total_elements()
 
         if announce_session and self._session_start_callback is not None:
             self._session_start_callback()
@@ -269,6 +269,8 @@ class Element(Plugin):
         self.__reverse_build_deps = set()  # type: Set[Element]
         # Direct reverse runtime dependency Elements
         self.__reverse_runtime_deps = set()  # type: Set[Element]
+        # Dependency configurations collected while instantiating, if configure_dependencies() is implemented
+        self.__custom_configurations = None  # type: Optional[List[DependencyConfiguration]]
         self.__build_deps_uncached = None  # Build dependencies which are not yet cached
         self.__runtime_deps_uncached = None  # Runtime dependencies which are not yet cached
         self.__ready_for_runtime_and_cached = False  # Whether all runtime deps are cached, as well as the element
@@ -827,33 +829,55 @@ class Element(Plugin):
                         yield dep
         else:
 
-            def visit(element, scope, visited):
+            # visit_element()
+            #
+            # Mark an element as visited in the given scope, and
+            # get the dependencies which need to be visited from it.
+            #
+            def visit_element(element, scope, visited):
                 if scope == _Scope.ALL:
                     visited[0].add(element._unique_id)
                     visited[1].add(element._unique_id)
-
-                    for dep in chain(element.__build_dependencies, element.__runtime_dependencies):
-                        if dep._unique_id not in visited[0] and dep._unique_id not in visited[1]:
-                            yield from visit(dep, _Scope.ALL, visited)
-
-                    yield element
+                    return chain(element.__build_dependencies, element.__runtime_dependencies)
                 elif scope == _Scope.BUILD:
                     visited[0].add(element._unique_id)
-
-                    for dep in element.__build_dependencies:
-                        if dep._unique_id not in visited[1]:
-                            yield from visit(dep, _Scope.RUN, visited)
-
-                elif scope == _Scope.RUN:
+                    return iter(element.__build_dependencies)
+                else:
                     visited[1].add(element._unique_id)
+                    return iter(element.__runtime_dependencies)
 
-                    for dep in element.__runtime_dependencies:
-                        if dep._unique_id not in visited[1]:
-                            yield from visit(dep, _Scope.RUN, visited)
-
-                    yield element
-                else:
+            # visit()
+            #
+            # Walk the dependencies in post order, with an explicit stack
+            # of (element, scope, remaining dependencies) so that the depth
+            # of the graph is not limited by the interpreter's recursion limit.
+            #
+            # Dependencies of an element in the ALL scope are visited in
+            # the ALL scope, all other dependencies are visited in the RUN
+            # scope. Elements are yielded after their dependencies, except
+            # for the toplevel element of a BUILD scope walk.
+            #
+            def visit(element, scope, visited):
+                if scope not in (_Scope.ALL, _Scope.BUILD, _Scope.RUN):
                     yield element
+                    return
+
+                stack = [(element, scope, visit_element(element, scope, visited))]
+                while stack:
+                    element, scope, dependencies = stack[-1]
+
+                    for dep in dependencies:
+                        if scope == _Scope.ALL:
+                            if dep._unique_id not in visited[0] and dep._unique_id not in visited[1]:
+                                stack.append((dep, _Scope.ALL, visit_element(dep, _Scope.ALL, visited)))
+                                break
+                        elif dep._unique_id not in visited[1]:
+                            stack.append((dep, _Scope.RUN, visit_element(dep, _Scope.RUN, visited)))
+                            break
+                    else:
+                        stack.pop()
+                        if scope != _Scope.BUILD:
+                            yield element
 
             if visited is None:
                 # Visited is of the form (Visited for _Scope.BUILD, Visited for _Scope.RUN)
@@ -979,11 +1003,12 @@ class Element(Plugin):
 
     # _new_from_load_element():
     #
-    # Recursively instantiate a new Element instance, its sources
+    # Instantiate a new Element instance, its sources
     # and its dependencies from a LoadElement.
     #
-    # FIXME: Need to use an iterative algorithm here since recursion
-    #        will limit project dependency depth.
+    # The dependency graph is walked iteratively with an explicit
+    # stack, so that the depth of a project's dependency chains is
+    # not limited by the interpreter's recursion limit.
     #
     # Args:
     #    load_element (LoadElement): The LoadElement
@@ -1001,86 +1026,50 @@ class Element(Plugin):
         with suppress(KeyError):
             return cls.__instantiated_elements[load_element]
 
-        element = load_element.project.create_element(load_element)
-        cls.__instantiated_elements[load_element] = element
+        toplevel = cls.__new_from_load_element(load_element)
 
-        # If the element implements configure_dependencies(), we will collect
-        # the dependency configurations for it, otherwise we will consider
-        # it an error to specify `config` on dependencies.
+        # Each stack entry holds an element whose dependencies are being
+        # instantiated, an iterator over its remaining dependencies and
+        # the dependency currently being instantiated, if any.
         #
-        if element.configure_dependencies.__func__ is not Element.configure_dependencies:
-            custom_configurations = []
-        else:
-            custom_configurations = None
-
-        # Load the sources from the LoadElement
-        element.__load_sources(load_element)
-
-        # Instantiate dependencies
-        for dep in load_element.dependencies:
-            dependency = Element._new_from_load_element(dep.element, task)
-
-            if dep.dep_type & DependencyType.BUILD:
-                element.__build_dependencies.append(dependency)
-                dependency.__reverse_build_deps.add(element)
-
-                # Configuration data is only collected for build dependencies,
-                # if configuration data is specified on a runtime dependency
-                # then the assertion will be raised by the LoadElement.
-                #
-                if custom_configurations is not None:
-
-                    # Create a proxy for the dependency
-                    dep_proxy = cast("Element", ElementProxy(element, dependency))
-
-                    # Class supports dependency configuration
-                    if dep.config_nodes:
-
-                        # Ensure variables are substituted first
-                        #
-                        for config in dep.config_nodes:
-                            element.__variables.expand(config)
-
-                        custom_configurations.extend(
-                            [DependencyConfiguration(dep_proxy, dep.path, config) for config in dep.config_nodes]
-                        )
-                    else:
-                        custom_configurations.append(DependencyConfiguration(dep_proxy, dep.path, None))
-
-                elif dep.config_nodes:
-                    # Class does not support dependency configuration
-                    provenance = dep.config_nodes[0].get_provenance()
-                    raise LoadError(
-                        "{}: Custom dependency configuration is not supported by element plugin '{}'".format(
-                            provenance, element.get_kind()
-                        ),
-                        LoadErrorReason.INVALID_DEPENDENCY_CONFIG,
-                    )
-
-            if dep.dep_type & DependencyType.RUNTIME:
-                element.__runtime_dependencies.append(dependency)
-                dependency.__reverse_runtime_deps.add(element)
-
-            if dep.strict:
-                element.__strict_dependencies.append(dependency)
-
-        no_of_runtime_deps = len(element.__runtime_dependencies)
-        element.__runtime_deps_uncached = no_of_runtime_deps
+        # An element is completed once all of its dependencies are
+        # completed and have been added to it, in the same order as
+        # they are declared.
+        #
+        # The mangled private names are looked up once per element rather
+        # than once per dependency edge, this loop is hot on large graphs.
+        #
+        instantiated_elements = cls.__instantiated_elements
+        new_from_load_element = cls.__new_from_load_element
 
-        no_of_build_deps = len(element.__build_dependencies)
-        element.__build_deps_uncached = no_of_build_deps
+        stack = [[toplevel, iter(load_element.dependencies), None]]
+        while stack:
+            entry = stack[-1]
+            element, dependencies, pending_dep = entry
+            add_dependency = element.__add_dependency
 
-        if custom_configurations is not None:
-            element.configure_dependencies(custom_configurations)
+            if pending_dep is not None:
+                add_dependency(pending_dep, instantiated_elements[pending_dep.element])
+                entry[2] = None
 
-        element.__preflight()
+            for dep in dependencies:
+                dep_element = dep.element
+                if not dep_element.first_pass:
+                    dep_element.project.ensure_fully_loaded()
 
-        element._initialize_state()
+                try:
+                    dependency = instantiated_elements[dep_element]
+                except KeyError:
+                    entry[2] = dep
+                    stack.append([new_from_load_element(dep_element), iter(dep_element.dependencies), None])
+                    break
 
-        if task:
-            task.add_current_progress()
+                add_dependency(dep, dependency)
+            else:
+                stack.pop()
+                element.__complete_instantiation(task)
 
-        return element
+        return toplevel
 
     # _clear_meta_elements_cache()
     #
@@ -2431,6 +2420,115 @@ class Element(Plugin):
         self.__proxies[owner] = proxy
         return proxy
 
+    # __new_from_load_element()
+    #
+    # Create the Element for a LoadElement and load its sources, the
+    # dependencies are added separately with __add_dependency().
+    #
+    # Args:
+    #    load_element (LoadElement): The LoadElement
+    #
+    # Returns:
+    #    (Element): A newly created Element instance
+    #
+    @classmethod
+    def __new_from_load_element(cls, load_element):
+        element = load_element.project.create_element(load_element)
+        cls.__instantiated_elements[load_element] = element
+
+        # If the element implements configure_dependencies(), we will collect
+        # the dependency configurations for it, otherwise we will consider
+        # it an error to specify `config` on dependencies.
+        #
+        if element.configure_dependencies.__func__ is not Element.configure_dependencies:
+            element.__custom_configurations = []
+
+        # Load the sources from the LoadElement
+        element.__load_sources(load_element)
+
+        return element
+
+    # __add_dependency()
+    #
+    # Add an instantiated dependency to this element
+    #
+    # Args:
+    #    dep (Dependency): The Dependency from the LoadElement
+    #    dependency (Element): The instantiated Element for `dep`
+    #
+    def __add_dependency(self, dep, dependency):
+        custom_configurations = self.__custom_configurations
+
+        if dep.dep_type & DependencyType.BUILD:
+            self.__build_dependencies.append(dependency)
+            dependency.__reverse_build_deps.add(self)
+
+            # Configuration data is only collected for build dependencies,
+            # if configuration data is specified on a runtime dependency
+            # then the assertion will be raised by the LoadElement.
+            #
+            if custom_configurations is not None:
+
+                # Create a proxy for the dependency
+                dep_proxy = cast("Element", ElementProxy(self, dependency))
+
+                # Class supports dependency configuration
+                if dep.config_nodes:
+
+                    # Ensure variables are substituted first
+                    #
+                    for config in dep.config_nodes:
+                        self.__variables.expand(config)
+
+                    custom_configurations.extend(
+                        [DependencyConfiguration(dep_proxy, dep.path, config) for config in dep.config_nodes]
+                    )
+                else:
+                    custom_configurations.append(DependencyConfiguration(dep_proxy, dep.path, None))
+
+            elif dep.config_nodes:
+                # Class does not support dependency configuration
+                provenance = dep.config_nodes[0].get_provenance()
+                raise LoadError(
+                    "{}: Custom dependency configuration is not supported by element plugin '{}'".format(
+                        provenance, self.get_kind()
+                    ),
+                    LoadErrorReason.INVALID_DEPENDENCY_CONFIG,
+                )
+
+        if dep.dep_type & DependencyType.RUNTIME:
+            self.__runtime_dependencies.append(dependency)
+            dependency.__reverse_runtime_deps.add(self)
+
+        if dep.strict:
+            self.__strict_dependencies.append(dependency)
+
+    # __complete_instantiation()
+    #
+    # Complete the instantiation of this element once all of
+    # its dependencies have been added.
+    #
+    # Args:
+    #    task (Task): A task object to report progress to
+    #
+    def __complete_instantiation(self, task):
+        no_of_runtime_deps = len(self.__runtime_dependencies)
+        self.__runtime_deps_uncached = no_of_runtime_deps
+
+        no_of_build_deps = len(self.__build_dependencies)
+        self.__build_deps_uncached = no_of_build_deps
+
+        if self.__custom_configurations is not None:
+            self.configure_dependencies(self.__custom_configurations)
+            self.__custom_configurations = None
+
+        self.__preflight()
+
+        self._initialize_state()
+
+        if task:
+            task.add_current_progress()
+
     # __load_sources()
     #
     # Load the Source objects from the LoadElement
@@ -209,10 +209,9 @@ class SandboxRemote(SandboxREAPI):
                     raise SandboxError("Failed to push source directory to remote: {}".format(e)) from e
 
             # Now request to execute the action
-            channel = self.exec_spec.open_channel()
-            with channel:
-                operation = self.run_remote_command(channel, action_digest)
-                action_result = self._extract_action_result(operation)
+            channel = self.exec_spec.next_channel()
+            operation = self.run_remote_command(channel, action_digest)
+            action_result = self._extract_action_result(operation)
 
         # Fetch outputs
         for output_directory in action_result.output_directories:
@@ -250,22 +249,21 @@ class SandboxRemote(SandboxREAPI):
         if not self.action_spec:
             return None
 
-        channel = self.action_spec.open_channel()
-        with channel:
-            request = remote_execution_pb2.GetActionResultRequest(
-                instance_name=self.action_spec.instance_name, action_digest=action_digest
-            )
-            stub = remote_execution_pb2_grpc.ActionCacheStub(channel)
-            try:
-                result = stub.GetActionResult(request)
-            except grpc.RpcError as e:
-                if e.code() != grpc.StatusCode.NOT_FOUND:
-                    raise SandboxError("Failed to query action cache: {} ({})".format(e.code(), e.details()))
-                return None
-            else:
-                context = self._get_context()
-                context.messenger.info("Action result found in action cache", element_name=self._get_element_name())
-                return result
+        channel = self.action_spec.next_channel()
+        request = remote_execution_pb2.GetActionResultRequest(
+            instance_name=self.action_spec.instance_name, action_digest=action_digest
+        )
+        stub = remote_execution_pb2_grpc.ActionCacheStub(channel)
+        try:
+            result = stub.GetActionResult(request)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.NOT_FOUND:
+                raise SandboxError("Failed to query action cache: {} ({})".format(e.code(), e.details()))
+            return None
+        else:
+            context = self._get_context()
+            context.messenger.info("Action result found in action cache", element_name=self._get_element_name())
+            return result
 
     @staticmethod
     def _extract_action_result(operation):
@@ -983,6 +983,10 @@ class Source(Plugin):
     # Args:
     #    new_ref (smth): The new reference to save
     #    save (bool): Whether to write the new reference to file or not
+    #    roundtrip_cache (dict): A dictionary of loaded files to apply the
+    #                            change to, shared by multiple calls. When
+    #                            given, the files are not written and the
+    #                            caller must call Source._save_roundtrip_cache()
     #
     # Returns:
     #    (bool): Whether the ref has changed
@@ -990,7 +994,7 @@ class Source(Plugin):
     # Raises:
     #    (SourceError): In the case we encounter errors saving a file to disk
     #
-    def _set_ref(self, new_ref, *, save):
+    def _set_ref(self, new_ref, *, save, roundtrip_cache=None):
 
         context = self._get_context()
         project = self._get_project()
@@ -1089,7 +1093,10 @@ class Source(Plugin):
             else:
                 assert False, "BUG: Unknown action: {}".format(action)
 
-        roundtrip_cache = {}
+        save_files = roundtrip_cache is None
+        if roundtrip_cache is None:
+            roundtrip_cache = {}
+
         for key, action in actions.items():
             # Obtain the top level node and its file
             if action == "add":
@@ -1107,11 +1114,11 @@ class Source(Plugin):
                 # We want the path to the node containing the key, not to the key
                 path = full_path[:-1]
 
-            roundtrip_file = roundtrip_cache.get(provenance._filename)
-            if not roundtrip_file:
-                roundtrip_file = roundtrip_cache[provenance._filename] = _yaml.roundtrip_load(
-                    provenance._filename, allow_missing=True
-                )
+            try:
+                _, roundtrip_file = roundtrip_cache[provenance._filename]
+            except KeyError:
+                roundtrip_file = _yaml.roundtrip_load(provenance._filename, allow_missing=True)
+                roundtrip_cache[provenance._filename] = (self, roundtrip_file)
 
             # Get the value of the round trip file that we need to change
             process_value(action, roundtrip_file, path, key, to_modify.get(key))
@@ -1119,17 +1126,34 @@ class Source(Plugin):
         #
         # Step 3 - Apply the change in project data
         #
-        for filename, data in roundtrip_cache.items():
+        if save_files:
+            Source._save_roundtrip_cache(roundtrip_cache)
+
+        return True
+
+    # _save_roundtrip_cache()
+    #
+    # Writes out the files modified by one or more calls to _set_ref()
+    #
+    # Args:
+    #    roundtrip_cache (dict): The loaded files to write, by filename,
+    #                            along with the source which loaded them
+    #
+    # Raises:
+    #    (SourceError): In the case we encounter errors saving a file to disk
+    #
+    @staticmethod
+    def _save_roundtrip_cache(roundtrip_cache):
+        for filename, (source, data) in roundtrip_cache.items():
             # This is our roundtrip dump from the track
             try:
                 _yaml.roundtrip_dump(data, filename)
             except OSError as e:
                 raise SourceError(
-                    "{}: Error saving source reference to '{}': {}".format(self, filename, e), reason="save-ref-error"
+                    "{}: Error saving source reference to '{}': {}".format(source, filename, e),
+                    reason="save-ref-error",
                 ) from e
 
-        return True
-
     # Wrapper for track()
     #
     # Args:
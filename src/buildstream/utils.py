@@ -44,7 +44,7 @@ import datetime
 import itertools
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, IO, Iterable, Iterator, Optional, Tuple, Union
+from typing import Callable, Dict, IO, Iterable, Iterator, Optional, Tuple, Union
 from dateutil import parser as dateutil_parser
 from google.protobuf import timestamp_pb2
 
@@ -71,6 +71,9 @@ _URI_SCHEMES = ["http", "https", "ftp", "file", "git", "sftp", "ssh"]
 _UMASK = os.umask(0o777)
 os.umask(_UMASK)
 
+# Host tools which were already found, keyed by name and search path
+_HOST_TOOL_CACHE = {}  # type: Dict[Tuple[str, Optional[str]], str]
+
 
 class UtilError(BstError):
     """Raised by utility functions when system calls fail.
@@ -588,11 +591,21 @@ def get_host_tool(name: str) -> str:
        :class:`.ProgramNotFoundError`
     """
     search_path = os.environ.get("PATH")
+    key = (name, search_path)
+
+    # Many plugins look up the same tools at preflight time, only successful
+    # lookups are remembered and they are dropped if the tool goes away.
+    program_path = _HOST_TOOL_CACHE.get(key)
+    if program_path and os.access(program_path, os.X_OK):
+        return program_path
+
     program_path = shutil.which(name, path=search_path)
 
     if not program_path:
+        _HOST_TOOL_CACHE.pop(key, None)
         raise ProgramNotFoundError("Did not find '{}' in PATH: {}".format(name, search_path))
 
+    _HOST_TOOL_CACHE[key] = program_path
     return program_path
 
 
@@ -2,7 +2,11 @@
 # pylint: disable=redefined-outer-name
 
 import os
+from functools import partial
+
 import pytest
+from buildstream._frontend import complete
+from buildstream._frontend.cli import cli as bst_cli, override_completions
 from buildstream._testing import cli  # pylint: disable=unused-import
 
 # Project directory
@@ -373,3 +377,46 @@ def test_argument_artifact(cli, datafiles):
                 expected2 = list(reversed(artifacts))
 
             assert words in (expected1, expected2)
+
+
+# Test that completions are cached outside of the test suite, and
+# that the cache is bypassed for other command lines and once expired
+def test_completion_cache(tmpdir, monkeypatch, capsys):
+    cache_dir = os.path.join(str(tmpdir), "buildstream", "completions")
+    monkeypatch.delenv("BST_TEST_SUITE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    monkeypatch.setenv("COMP_CWORD", "1")
+
+    def complete_words(comp_words):
+        monkeypatch.setenv("COMP_WORDS", comp_words)
+        complete.do_complete(bst_cli, "bst", partial(override_completions, []))
+        return sorted(capsys.readouterr().out.splitlines())
+
+    # The first completion populates the cache
+    assert complete_words("bst w") == ["workspace "]
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1
+    cache_file = os.path.join(cache_dir, cache_files[0])
+
+    # Tamper with the cached results to observe when they are used
+    with open(cache_file, "w", encoding="utf-8") as f:
+        f.write("cached\n")
+    assert complete_words("bst w") == ["cached"]
+
+    # Another command line does not use the cached results
+    assert complete_words("bst s") == ["shell ", "show ", "source "]
+    assert len(os.listdir(cache_dir)) == 2
+
+    # Expired results are not used
+    expired = os.stat(cache_file).st_mtime - complete.COMPLETION_CACHE_TIMEOUT - 1
+    for cache_file in os.listdir(cache_dir):
+        os.utime(os.path.join(cache_dir, cache_file), (expired, expired))
+    assert complete_words("bst w") == ["workspace "]
+    assert len(os.listdir(cache_dir)) == 2
+
+    # Expired cache files are removed once nothing was cached for a while
+    for cache_file in os.listdir(cache_dir):
+        os.utime(os.path.join(cache_dir, cache_file), (expired, expired))
+    os.utime(cache_dir, (expired, expired))
+    assert complete_words("bst w") == ["workspace "]
+    assert len(os.listdir(cache_dir)) == 1
@@ -2,7 +2,6 @@
 # pylint: disable=redefined-outer-name
 
 import os
-import sys
 import shutil
 import pytest
 from buildstream._testing import cli  # pylint: disable=unused-import
@@ -367,7 +366,7 @@ def test_fetched_junction(cli, tmpdir, datafiles, element_name, workspaced):
 #                   Testing recursion depth                   #
 ###############################################################
 @pytest.mark.parametrize("dependency_depth", [100, 150, 1200])
-def test_exceed_max_recursion_depth(cli, tmpdir, dependency_depth):
+def test_deep_dependency_chain(cli, tmpdir, dependency_depth):
     project_name = "recursion-test"
     path = str(tmpdir)
     project_path = os.path.join(path, project_name)
@@ -404,13 +403,9 @@ def test_exceed_max_recursion_depth(cli, tmpdir, dependency_depth):
     setup_test()
     result = cli.run(project=project_path, silent=True, args=["show", "element{}.bst".format(str(dependency_depth))])
 
-    recursion_limit = sys.getrecursionlimit()
-    if dependency_depth <= recursion_limit:
-        result.assert_success()
-    else:
-        #  Assert exception is thown and handled
-        assert not result.unhandled_exception
-        assert result.exit_code == -1
+    # The depth of the dependency chain is not limited
+    # by the interpreter's recursion limit
+    result.assert_success()
 
     shutil.rmtree(project_path)
 
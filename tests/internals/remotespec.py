@@ -0,0 +1,65 @@
+# Pylint doesn't play well with fixtures and dependency injection from pytest
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from buildstream._remotespec import RemoteSpec, RemoteType, close_channels
+from buildstream._exceptions import RemoteError
+
+
+# Test that failing to open a channel does not leave
+# an empty channel pool behind for the spec
+def test_channel_error_leaves_no_pool():
+    spec = RemoteSpec(RemoteType.ENDPOINT, "http://buildservice")
+
+    with pytest.raises(RemoteError):
+        spec.next_channel()
+
+    with pytest.raises(RemoteError):
+        spec.open_channel()
+
+
+# Test that channels are shared until they are closed
+def test_close_channels():
+    spec = RemoteSpec(RemoteType.ALL, "http://cache.example.com:11001")
+    channel = spec.open_channel()
+    assert RemoteSpec(RemoteType.ALL, "http://cache.example.com:11001").open_channel() is channel
+
+    close_channels()
+    assert spec.open_channel() is not channel
+    close_channels()
+
+
+# Test that urls which cannot be parsed are reported as RemoteErrors
+def test_unparsable_url():
+    with pytest.raises(RemoteError, match="Invalid URL"):
+        RemoteSpec.new_from_string("http://[::1")
+
+
+# Test that an invalid port number is reported as such,
+# even for specs which must specify the port number
+@pytest.mark.parametrize("remote_type", [RemoteType.ALL, RemoteType.ENDPOINT])
+def test_invalid_port(remote_type):
+    spec = RemoteSpec(remote_type, "http://buildservice:99999")
+
+    with pytest.raises(RemoteError, match="Invalid port number"):
+        spec.open_channel()
+
+
+# Test parsing the remote type from the command line
+@pytest.mark.parametrize(
+    "type_string, remote_type",
+    [("index", RemoteType.INDEX), ("storage", RemoteType.STORAGE), ("all", RemoteType.ALL)],
+)
+def test_remote_type_from_string(type_string, remote_type):
+    spec = RemoteSpec.new_from_string("url=https://cache.example.com,type={}".format(type_string))
+    assert spec.remote_type is remote_type
+    assert str(spec.remote_type) == type_string
+
+
+# Test that invalid remote types are rejected on the command line,
+# including the endpoint type which is only used for remote execution
+@pytest.mark.parametrize("type_string", ["pony", "endpoint"])
+def test_invalid_remote_type_from_string(type_string):
+    with pytest.raises(RemoteError, match="Value for remote 'type' must be one of: index, storage, all"):
+        RemoteSpec.new_from_string("url=https://cache.example.com,type={}".format(type_string))
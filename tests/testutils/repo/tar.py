@@ -1,3 +1,4 @@
+import gzip
 import os
 import tarfile
 
@@ -10,11 +11,12 @@ class Tar(Repo):
     def create(self, directory):
         tarball = os.path.join(self.repo, "file.tar.gz")
 
-        old_dir = os.getcwd()
-        os.chdir(directory)
-        with tarfile.open(tarball, "w:gz") as tar:
-            tar.add(".")
-        os.chdir(old_dir)
+        # The compression ratio does not matter for test data, favor speed
+        # and write through a large buffer
+        with open(tarball, "wb", buffering=1 << 20) as f:
+            with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=1) as gz:
+                with tarfile.open(fileobj=gz, mode="w") as tar:
+                    tar.add(directory, arcname=".")
 
         return sha256sum(tarball)
 
@@ -0,0 +1,9 @@
+from buildstream import Element
+
+
+class FrobElement(Element):
+    pass
+
+
+def setup():
+    return FrobElement
@@ -0,0 +1,9 @@
+from buildstream import Element
+
+
+class FooElement(Element):
+    pass
+
+
+def setup():
+    return FooElement
@@ -0,0 +1,19 @@
+from buildstream import Element
+
+
+class ConfigUnsupported(Element):
+    BST_MIN_VERSION = "2.0"
+
+    def configure(self, node):
+        pass
+
+    def preflight(self):
+        pass
+
+    def get_unique_key(self):
+        return {}
+
+
+# Plugin entry point
+def setup():
+    return ConfigUnsupported